@@ -3,6 +3,9 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import os
+import hashlib
+import tempfile
 from datetime import datetime, timedelta
 
 # Page configuration
@@ -52,22 +55,54 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# Bot account list (manually maintained)
-BOT_ACCOUNTS = [
-    "dependabot",
-    "dependabot[bot]",
-    "dependabot-preview[bot]",
-    "github-actions[bot]",
-    "renovate[bot]",
-    "greenkeeper[bot]",
-    "imgbot[bot]",
-    "allcontributors[bot]",
-    "semantic-release-bot",
-    "snyk-bot",
-    "codecov[bot]",
-    "netlify[bot]",
-    "whitesource-bolt-for-github[bot]",
+# Source data: only the columns the dashboard uses, typed and date-parsed
+CSV_PATH = "healthcare_data.csv"
+CSV_USECOLS = [
+    "Repository",
+    "Category",
+    "Subcat",
+    "Standard",
+    "Language",
+    "Stars",
+    "Created",
+    "Last Commit",
+    "Top Contributors",
 ]
+CSV_DTYPES = {
+    "Repository": "string",
+    "Category": "category",
+    "Subcat": "category",
+    "Language": "category",
+    "Stars": "int32",
+    "Top Contributors": "string",
+}
+CSV_DATE_COLUMNS = ["Created", "Last Commit"]
+
+# Typed Parquet copies of the CSV are named after the read schema and the
+# exact CSV file they came from (see parquet_path_for)
+CSV_SCHEMA_HASH = hashlib.sha1(
+    repr((CSV_USECOLS, CSV_DTYPES, CSV_DATE_COLUMNS)).encode()
+).hexdigest()[:12]
+PARQUET_PREFIX = "healthcare_data."
+
+# Bot account list (manually maintained, lowercase)
+BOT_ACCOUNTS = frozenset(
+    {
+        "dependabot",
+        "dependabot[bot]",
+        "dependabot-preview[bot]",
+        "github-actions[bot]",
+        "renovate[bot]",
+        "greenkeeper[bot]",
+        "imgbot[bot]",
+        "allcontributors[bot]",
+        "semantic-release-bot",
+        "snyk-bot",
+        "codecov[bot]",
+        "netlify[bot]",
+        "whitesource-bolt-for-github[bot]",
+    }
+)
 
 # Standard organizations to exclude from org charts
 # STANDARD_ORGS_TO_EXCLUDE = [
@@ -81,10 +116,76 @@ BOT_ACCOUNTS = [
 # ]
 
 
+def parquet_path_for(csv_stat):
+    """Name of the Parquet copy for this read schema and CSV file version"""
+    # Matching on the CSV's exact mtime and size (not on mtime ordering) also
+    # catches a replacement CSV copied in with an older timestamp
+    return (
+        f"{PARQUET_PREFIX}{CSV_SCHEMA_HASH}."
+        f"{csv_stat.st_mtime_ns:x}-{csv_stat.st_size:x}.parquet"
+    )
+
+
+def read_repository_data():
+    """Read the repository CSV, via a typed Parquet copy when it is up to date"""
+    # Parquet keeps the dtypes (including categoricals), so only the first run
+    # after the CSV changes pays for text parsing
+    parquet_path = parquet_path_for(os.stat(CSV_PATH))
+    if os.path.exists(parquet_path):
+        # An unreadable or corrupt copy falls through to the CSV and is rewritten
+        try:
+            return pd.read_parquet(parquet_path)
+        except (OSError, ValueError):
+            pass
+
+    df = pd.read_csv(
+        CSV_PATH,
+        usecols=CSV_USECOLS,
+        dtype=CSV_DTYPES,
+        parse_dates=CSV_DATE_COLUMNS,
+    )
+
+    # Write to a temporary file and swap it in, so another process starting at
+    # the same time never reads a half-written copy. A read-only checkout just
+    # keeps reading the CSV.
+    cache_dir = os.path.dirname(os.path.abspath(parquet_path))
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+    except OSError:
+        return df
+    try:
+        with os.fdopen(fd, "wb") as f:
+            df.to_parquet(f, index=False)
+        # mkstemp creates the file as 0600; give it the usual umask permissions
+        # so other users running the app can read it
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    # Drop copies made for older CSV versions or read schemas
+    for name in os.listdir(cache_dir):
+        if (
+            name.startswith(PARQUET_PREFIX)
+            and name.endswith(".parquet")
+            and name != os.path.basename(parquet_path)
+        ):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+    return df
+
+
 @st.cache_data
 def load_and_process_data():
-    """Load and process the healthcare repository data"""
-    df = pd.read_csv("healthcare_data.csv")
+    """Load and process the healthcare repository data and its long tables"""
+    df = read_repository_data()
 
     # Remove unimportant categories
     df = df[
@@ -97,67 +198,116 @@ def load_and_process_data():
                 "Educational",
             ]
         )
-    ]
-
-    # Convert to datetime
-    df["Created"] = pd.to_datetime(df["Created"])
-    df["Last Commit"] = pd.to_datetime(df["Last Commit"])
+    ].copy()
+    for col in ["Category", "Subcat", "Language"]:
+        df[col] = df[col].cat.remove_unused_categories()
 
     # Create new columns
     today = datetime.now()
-    df["days_since_last_commit"] = (today - df["Last Commit"]).apply(lambda x: x.days)
+    since_last_commit = today - df["Last Commit"]
+    df["days_since_last_commit"] = since_last_commit.dt.days
+    # Repositories with no listed contributors count as zero, not one
+    listed = df["Top Contributors"].fillna("")
     df["contributor_count"] = (
-        df["Top Contributors"].fillna("").str.split(",").apply(len)
+        (listed.str.count(",") + 1).where(listed != "", 0).astype("int16")
     )
-    df["Org"] = df["Repository"].str.split("/").str[0]
 
-    # Active definition: committed within last 365 days
-    df["recent_activity_category"] = np.where(
-        df["days_since_last_commit"] < 365, "Active", "Inactive"
+    df["Org"] = df["Repository"].str.split("/", n=1).str[0]
+
+    # Active definition: committed within last 365 days (no last commit counts
+    # as inactive)
+    df["recent_activity_category"] = pd.Categorical.from_codes(
+        (~df["days_since_last_commit"].lt(365)).astype("int8"),
+        categories=["Active", "Inactive"],
     )
 
     # Additional processing for visualizations
-    df["first_commit"] = df["Created"]
-    df["last_commit"] = df["Last Commit"]
-    df["lifespan_days"] = (df["last_commit"] - df["first_commit"]).dt.days
-    df["start_year"] = df["first_commit"].dt.year
-    df["is_active"] = df["last_commit"] >= (today - timedelta(days=365))
+    df["lifespan_days"] = (df["Last Commit"] - df["Created"]).dt.days
+    df["start_year"] = df["Created"].dt.year
+    df["is_active"] = since_last_commit <= timedelta(days=365)
 
     # Process Standard column - handle multiple standards
     df["Standard"] = df["Standard"].fillna("None/Unknown")
     df["has_standard"] = df["Standard"] != "None/Unknown"
 
-    # Create exploded dataframe for multi-standard analysis
-    df["standards_list"] = df["Standard"].apply(
-        lambda x: [s.strip() for s in str(x).split(",") if s.strip()]
-    )
-
     # Load the classified repos CSV (generated by the GitHub classifier script)
     classified_df = pd.read_csv("repos_classified.csv")
 
-    # Create a mapping dictionary from owner to organization status
-    owner_classification = (
-        classified_df.drop_duplicates(subset=["owner"])
-        .set_index("owner")[["is_organization", "owner_type"]]
-        .to_dict("index")
+    # Index the classification by owner so it can be looked up per Org
+    owner_classification = classified_df.drop_duplicates(subset=["owner"]).set_index(
+        "owner"
     )
 
-    # Apply the classification to your main dataframe
-    df["is_organization"] = df["Org"].map(
-        lambda x: owner_classification.get(x, {}).get("is_organization", None)
+    # Apply the classification to your main dataframe; unclassified owners get
+    # a missing is_organization and an "Unknown" owner type
+    df["is_organization"] = df["Org"].map(owner_classification["is_organization"])
+    df["owner_type"] = (
+        df["Org"].map(owner_classification["owner_type"]).fillna("Unknown")
     )
-    df["owner_type"] = df["Org"].map(
-        lambda x: owner_classification.get(x, {}).get("owner_type", "Unknown")
+
+    # Store low-cardinality text columns as categories and shrink numeric ones
+    for col in ["Org", "Standard", "owner_type"]:
+        df[col] = df[col].astype("category")
+
+    for col in ["Stars", "days_since_last_commit", "lifespan_days", "start_year"]:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+
+    # Explode contributors to one row per (contributor, repository), keeping
+    # the repository's index so the table can be sliced with any filter of df
+    contributors_long = (
+        df[
+            [
+                "Top Contributors",
+                "Repository",
+                "Stars",
+                "Category",
+                "Org",
+                "recent_activity_category",
+                "Standard",
+            ]
+        ]
+        .dropna(subset=["Top Contributors"])
+        .rename(
+            columns={
+                "Top Contributors": "Contributor",
+                "recent_activity_category": "Active",
+            }
+        )
     )
+    contributors_long["Contributor"] = contributors_long["Contributor"].str.split(", ")
+    contributors_long = contributors_long.explode("Contributor")
+    contributors_long["Contributor"] = contributors_long["Contributor"].str.strip()
 
-    return df
+    # Filter out bots
+    contributors_long = contributors_long[
+        ~contributors_long["Contributor"].str.lower().isin(BOT_ACCOUNTS)
+    ]
+
+    # Explode the comma-separated standards the same way, dropping empty
+    # entries and repositories without a known standard
+    standards_long = df[["Standard", "Category", "Stars", "Created"]].rename(
+        columns={"Standard": "standards_list"}
+    )
+    standards_long["standards_list"] = (
+        standards_long["standards_list"].astype(str).str.split(",")
+    )
+    standards_long = standards_long.explode("standards_list")
+    standards_long["standards_list"] = standards_long["standards_list"].str.strip()
+    standards_long = standards_long[
+        standards_long["standards_list"].ne("")
+        & standards_long["standards_list"].ne("None/Unknown")
+    ]
+
+    return df, contributors_long, standards_long
 
 
 @st.cache_data
 def load_contribution_data():
-    """Load contributor statistics from GitHub analysis"""
+    """Load contributor statistics from GitHub analysis, indexed by username"""
     try:
-        contrib_df = pd.read_csv("contributor_detailed_stats_aggregated.csv")
+        contrib_df = pd.read_csv(
+            "contributor_detailed_stats_aggregated.csv", index_col="username"
+        )
         return contrib_df
     except FileNotFoundError:
         st.warning(
@@ -166,1147 +316,1454 @@ def load_contribution_data():
         return None
 
 
-# Load data
-try:
-    df = load_and_process_data()
-    contrib_stats = load_contribution_data()
+@st.cache_data
+def filter_df(
+    selected_categories: tuple,
+    activity_filter: str,
+    min_stars: int,
+    selected_standard: str = "All",
+) -> pd.DataFrame:
+    """Apply the sidebar filters to the processed data"""
+    df, _, _ = load_and_process_data()
+
+    # Combine every predicate into one mask so the frame is copied only once
+    mask = df["Category"].isin(selected_categories) & (df["Stars"] >= min_stars)
+    if activity_filter == "Active Only":
+        mask &= df["recent_activity_category"] == "Active"
+    elif activity_filter == "Inactive Only":
+        mask &= df["recent_activity_category"] == "Inactive"
 
-    # Title and introduction
-    st.markdown(
-        '<p class="main-header">Healthcare AI Repository Dashboard</p>',
-        unsafe_allow_html=True,
-    )
-    st.markdown(
-        "Explore insights from healthcare AI repositories including stars, activity, and top contributors."
-    )
+    if selected_standard != "All":
+        mask &= df["Standard"] == selected_standard
 
-    # Sidebar filters
-    st.sidebar.header("Filters")
+    return df[mask]
 
-    selected_categories = st.sidebar.multiselect(
-        "Select Categories",
-        options=sorted(df["Category"].unique()),
-        default=sorted(df["Category"].unique()),
-    )
 
-    activity_filter = st.sidebar.radio(
-        "Repository Activity", options=["All", "Active Only", "Inactive Only"], index=0
+@st.cache_data
+def get_filtered_contributors(
+    selected_categories: tuple,
+    activity_filter: str,
+    min_stars: int,
+    selected_standard: str = "All",
+) -> pd.DataFrame:
+    """Contributor rows (bots already removed) of the filtered repositories"""
+    _, contributors_long, _ = load_and_process_data()
+    filtered_df = filter_df(
+        selected_categories, activity_filter, min_stars, selected_standard
     )
+    return contributors_long[
+        contributors_long.index.isin(filtered_df.index)
+    ].reset_index(drop=True)
 
-    min_stars = st.sidebar.slider(
-        "Minimum Stars", min_value=0, max_value=int(df["Stars"].max()), value=0
+
+@st.cache_data
+def get_filtered_standards(
+    selected_categories: tuple,
+    activity_filter: str,
+    min_stars: int,
+    selected_standard: str = "All",
+) -> pd.DataFrame:
+    """Standard rows of the filtered repositories, indexed by repository"""
+    _, _, standards_long = load_and_process_data()
+    filtered_df = filter_df(
+        selected_categories, activity_filter, min_stars, selected_standard
     )
+    return standards_long[standards_long.index.isin(filtered_df.index)]
 
-    # Standard filter
-    if "Standard" in df.columns:
-        standard_options = ["All"] + sorted(df["Standard"].unique().tolist())
-        selected_standard = st.sidebar.selectbox(
-            "Filter by Standard", options=standard_options, index=0
-        )
 
-    # Apply filters
-    filtered_df = df[df["Category"].isin(selected_categories)]
-    if activity_filter == "Active Only":
-        filtered_df = filtered_df[filtered_df["recent_activity_category"] == "Active"]
-    elif activity_filter == "Inactive Only":
-        filtered_df = filtered_df[filtered_df["recent_activity_category"] == "Inactive"]
-    filtered_df = filtered_df[filtered_df["Stars"] >= min_stars]
+def observed_value_counts(series):
+    """value_counts() without the zero rows a categorical adds for unused categories"""
+    counts = series.value_counts()
+    return counts[counts > 0]
 
-    if "Standard" in df.columns and selected_standard != "All":
-        filtered_df = filtered_df[filtered_df["Standard"] == selected_standard]
 
-    # Overview metrics
-    col1, col2, col3, col4, col5 = st.columns(5)
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("Total Repositories", len(filtered_df))
-    with col2:
-        st.metric("Total Stars", f"{filtered_df['Stars'].sum():,}")
-    with col3:
-        st.metric(
-            "Active Repos",
-            len(filtered_df[filtered_df["recent_activity_category"] == "Active"]),
-        )
-    with col4:
-        st.metric("Unique Organizations", filtered_df["Org"].nunique())
-    with col5:
-        if "Standard" in df.columns:
-            std_count = filtered_df[filtered_df["has_standard"]].shape[0]
-            st.metric("With Standards", std_count)
+def observed_categories(series):
+    """Categories that occur in a categorical series, in (sorted) category order"""
+    return list(series.cat.remove_unused_categories().cat.categories)
 
-    # Add definitions box
-    with st.expander("ℹ️ Definitions & Methodology"):
-        st.markdown(
-            """
-        **Active Repository**: A repository is considered "active" if it has had at least one commit within the last 365 days.
 
-        **Survival Rate**: The percentage of repositories created in a given year that are still active today (have commits within the last 365 days).
+@st.cache_data
+def get_category_counts(filtered_df):
+    """Count repositories per category"""
+    return observed_value_counts(filtered_df["Category"])
 
-        **Organization vs Individual**: Accounts with more than 3 repositories in this dataset are classified as organizations; others are classified as individuals.
 
-        **Top Contributors**: When contribution statistics are available, contributors are ranked by total lines of code added across all repositories.
-        """
-        )
+@st.cache_data
+def get_language_counts(filtered_df, top_n=10):
+    """Count repositories per language, keeping the most common ones"""
+    return observed_value_counts(filtered_df["Language"]).head(top_n)
 
-    # Create tabs for different sections
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(
-        [
-            "Top Repositories",
-            "Category Analysis",
-            "Standards Analysis",
-            "Top Contributors",
-            "Temporal Analysis",
-        ]
+
+@st.cache_data
+def get_top_per_category(filtered_df, top_n=10):
+    """Most starred repositories of each category, from a single sort"""
+    return (
+        filtered_df.sort_values("Stars", ascending=False, kind="stable")
+        .groupby("Category", observed=True)
+        .head(top_n)
     )
 
-    # TAB 1: Top Repositories
-    with tab1:
-        st.markdown(
-            '<p class="sub-header">Top Starred Repositories by Category</p>',
-            unsafe_allow_html=True,
-        )
 
-        # Get categories to display
-        categories_to_show = sorted(filtered_df["Category"].unique())
-
-        # Create a grid layout - 2 columns
-        for i in range(0, len(categories_to_show), 2):
-            cols = st.columns(2)
-
-            for col_idx, col in enumerate(cols):
-                if i + col_idx < len(categories_to_show):
-                    category = categories_to_show[i + col_idx]
-
-                    with col:
-                        category_df = filtered_df[
-                            filtered_df["Category"] == category
-                        ].nlargest(10, "Stars")
-
-                        if len(category_df) > 0:
-                            fig = px.bar(
-                                category_df,
-                                y="Repository",
-                                x="Stars",
-                                orientation="h",
-                                title=f"Top 10 in {category}",
-                                color="Stars",
-                                color_continuous_scale="Blues",
-                                hover_data=["Subcat", "Language"],
-                            )
-                            fig.update_layout(
-                                height=400,
-                                yaxis={"categoryorder": "total ascending"},
-                                showlegend=False,
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
-
-        # Special highlight: Interoperability
-        st.markdown(
-            '<p class="sub-header">🌟 Spotlight: Top 10 Interoperability Projects</p>',
-            unsafe_allow_html=True,
-        )
+@st.cache_data
+def get_org_top(owner_df, top_n=15):
+    """Owners with the most total stars and with the most repositories"""
+    org_totals = owner_df.groupby("Org", observed=True)["Stars"].agg(["sum", "count"])
+    return org_totals["sum"].nlargest(top_n), org_totals["count"].nlargest(top_n)
 
-        interop_df = filtered_df[
-            filtered_df["Category"] == "Interoperability"
-        ].nlargest(10, "Stars")
-
-        if len(interop_df) > 0:
-            fig_interop = px.bar(
-                interop_df,
-                y="Repository",
-                x="Stars",
-                orientation="h",
-                title="Most Starred Interoperability Projects",
-                color="Stars",
-                color_continuous_scale="Viridis",
-                hover_data=["Subcat", "Language", "Standard"],
-            )
-            fig_interop.update_layout(
-                height=500, yaxis={"categoryorder": "total ascending"}, showlegend=False
-            )
-            st.plotly_chart(fig_interop, use_container_width=True)
 
-            # Show detailed table
-            st.markdown("#### Detailed Information")
-            display_cols = [
-                "Repository",
-                "Stars",
-                "Subcat",
-                "Language",
-                "Standard",
-                "recent_activity_category",
-            ]
-            st.dataframe(
-                interop_df[display_cols].sort_values("Stars", ascending=False),
-                use_container_width=True,
-                height=400,
-            )
-        else:
-            st.info("No Interoperability repositories in the current selection.")
+@st.cache_data
+def get_contributor_totals(contributors_df, contrib_stats):
+    """Per-contributor stars and repository count, plus lines added and commits
+    when contribution statistics are available"""
+    contributor_totals = contributors_df.groupby("Contributor").agg(
+        **{
+            "Total Stars": ("Stars", "sum"),
+            "Repo Count": ("Repository", "count"),
+        }
+    )
 
-    # TAB 2: Category Analysis
-    with tab2:
-        st.markdown(
-            '<p class="sub-header">Category Overview</p>', unsafe_allow_html=True
-        )
+    if contrib_stats is not None:
+        # Look the stats up by username; contributors without stats get 0
+        stats = contrib_stats.reindex(contributor_totals.index)
+        contributor_totals.insert(0, "Lines Added", stats["total_additions"].fillna(0))
+        contributor_totals.insert(1, "Total Commits", stats["total_commits"].fillna(0))
 
-        col1, col2 = st.columns(2)
+    return contributor_totals
 
-        with col1:
-            # Category counts with numbers
-            category_counts = filtered_df["Category"].value_counts()
-            fig_cat_pie = px.pie(
-                values=category_counts.values,
-                names=category_counts.index,
-                title="Repository Distribution by Category",
-                hole=0.4,
-            )
-            # Update to show both count and percentage
-            fig_cat_pie.update_traces(
-                textposition="inside", texttemplate="%{label}<br>%{value} (%{percent})"
-            )
-            fig_cat_pie.update_layout(height=450)
-            st.plotly_chart(fig_cat_pie, use_container_width=True)
 
-        with col2:
-            # Language distribution with numbers
-            language_counts = filtered_df["Language"].value_counts().head(10)
-            fig_lang_pie = px.pie(
-                values=language_counts.values,
-                names=language_counts.index,
-                title="Top 10 Programming Languages",
-                hole=0.4,
-            )
-            fig_lang_pie.update_traces(
-                textposition="inside", texttemplate="%{label}<br>%{value} (%{percent})"
-            )
-            fig_lang_pie.update_layout(height=450)
-            st.plotly_chart(fig_lang_pie, use_container_width=True)
+@st.cache_data
+def get_contributor_index(contributors_df):
+    """Contributor rows indexed and sorted by contributor, plus the sorted
+    contributor names, for the search panel"""
+    contributor_index = contributors_df.set_index("Contributor").sort_index(
+        kind="stable"
+    )
+    return contributor_index, contributor_index.index.unique().tolist()
 
-        # Stacked bar chart: Categories over time
-        st.markdown(
-            '<p class="sub-header">Category Growth Over Time</p>',
-            unsafe_allow_html=True,
-        )
 
-        category_timeline = (
-            filtered_df.groupby([pd.Grouper(key="first_commit", freq="Y"), "Category"])
-            .size()
-            .reset_index(name="count")
-        )
-        category_timeline["year"] = category_timeline["first_commit"].dt.year
-
-        fig_cat_timeline = px.bar(
-            category_timeline,
-            x="year",
-            y="count",
-            color="Category",
-            title="Repository Creation by Category Over Time",
-            labels={"count": "Number of Repositories", "year": "Year"},
-            barmode="stack",
+@st.cache_data
+def get_timeline_orders(timeline_df):
+    """Row positions of the timeline candidates for every sort option, keyed by
+    (column, largest_first), with ties in row order like nlargest/nsmallest"""
+    orders = {}
+    for column in ("Stars", "lifespan_days", "Created"):
+        values = timeline_df[column].to_numpy()
+        orders[column, False] = np.argsort(values, kind="stable")
+        # Descending via the reversed array, since negating would overflow the
+        # downcast integers and is undefined for datetimes
+        orders[column, True] = (
+            len(values) - 1 - np.argsort(values[::-1], kind="stable")[::-1]
         )
-        fig_cat_timeline.update_layout(height=500)
-        st.plotly_chart(fig_cat_timeline, use_container_width=True)
+    return orders
 
-        # Subcategory Explorer
-        st.markdown(
-            '<p class="sub-header">Subcategory Explorer</p>', unsafe_allow_html=True
-        )
 
-        selected_category_explorer = st.selectbox(
-            "Select a category to explore subcategories:",
-            options=["All Categories"]
-            + sorted(filtered_df["Category"].unique().tolist()),
-        )
+@st.cache_data
+def get_survival_by_year(filtered_df):
+    """Active vs total repositories and survival rate per start year"""
+    # Count repositories per year straight from the year codes
+    years, year_codes = np.unique(filtered_df["start_year"], return_inverse=True)
+    total_repos = np.bincount(year_codes, minlength=len(years))
+    active_repos = np.bincount(
+        year_codes, weights=filtered_df["is_active"], minlength=len(years)
+    ).astype("int64")
+    return pd.DataFrame(
+        {
+            "start_year": years,
+            "active_repos": active_repos,
+            "total_repos": total_repos,
+            "survival_rate": np.round(active_repos / total_repos * 100, 1),
+        }
+    )
 
-        if selected_category_explorer == "All Categories":
-            explorer_df = filtered_df
-        else:
-            explorer_df = filtered_df[
-                filtered_df["Category"] == selected_category_explorer
-            ]
 
-        # Stacked bar chart: Categories over time
-        st.markdown(
-            '<p class="sub-header">Subcategory Growth Over Time</p>',
-            unsafe_allow_html=True,
+@st.cache_data
+def get_category_timeline(filtered_df):
+    """Repositories created per year and category"""
+    category_timeline = (
+        filtered_df.groupby(
+            [pd.Grouper(key="Created", freq="Y"), "Category"], observed=True
         )
+        .size()
+        .reset_index(name="count")
+    )
+    category_timeline["year"] = category_timeline["Created"].dt.year
+    return category_timeline
 
-        subcategory_timeline = (
-            explorer_df.groupby([pd.Grouper(key="first_commit", freq="Y"), "Subcat"])
-            .size()
-            .reset_index(name="count")
-        )
-        subcategory_timeline["year"] = subcategory_timeline["first_commit"].dt.year
-
-        fig_subcat_timeline = px.bar(
-            subcategory_timeline,
-            x="year",
-            y="count",
-            color="Subcat",
-            title="Repository Creation by Subcategory Over Time",
-            labels={"count": "Number of Repositories", "year": "Year"},
-            barmode="stack",
-        )
-        fig_subcat_timeline.update_layout(height=500)
-        st.plotly_chart(fig_subcat_timeline, use_container_width=True)
 
-        col1, col2 = st.columns(2)
+@st.cache_data
+def get_owner_type_by_category(filtered_df):
+    """Repository count per (category, owner type) pair"""
+    return (
+        filtered_df[["Category", "owner_type"]]
+        .value_counts(sort=False)
+        .reset_index(name="count")
+    )
 
-        with col1:
-            # Subcategory distribution
-            subcat_counts = explorer_df["Subcat"].value_counts()
-            fig_subcat = px.bar(
-                x=subcat_counts.values,
-                y=subcat_counts.index,
-                orientation="h",
-                title=f"Subcategory Distribution - {selected_category_explorer}",
-                labels={"x": "Number of Repositories", "y": "Subcategory"},
-                color=subcat_counts.values,
-                color_continuous_scale="Teal",
-            )
-            fig_subcat.update_layout(
-                height=500, yaxis={"categoryorder": "total ascending"}
-            )
-            st.plotly_chart(fig_subcat, use_container_width=True)
 
-        with col2:
-            # Subcategory by activity
-            subcat_activity = (
-                explorer_df.groupby(["Subcat", "recent_activity_category"])
-                .size()
-                .reset_index(name="count")
-            )
-            fig_subcat_activity = px.bar(
-                subcat_activity,
-                x="Subcat",
-                y="count",
-                color="recent_activity_category",
-                title=f"Subcategory Activity Status - {selected_category_explorer}",
-                labels={"count": "Number of Repositories"},
-                barmode="stack",
-                color_discrete_map={"Active": "#2ecc71", "Inactive": "#e74c3c"},
-            )
-            fig_subcat_activity.update_layout(height=500)
-            st.plotly_chart(fig_subcat_activity, use_container_width=True)
+@st.cache_data
+def get_standard_counts(standards_exploded):
+    """Repository count per standard, most common first"""
+    # Count the integer codes; the stable sort keeps value_counts' tie order
+    # (first occurrence)
+    codes, standards = pd.factorize(standards_exploded["standards_list"])
+    counts = np.bincount(codes, minlength=len(standards))
+    order = np.argsort(-counts, kind="stable")
+    return pd.Series(
+        counts[order],
+        index=pd.Index(standards[order], name="standards_list"),
+        name="count",
+    )
 
-        # Organization vs Individual breakdown by category
-        st.markdown(
-            '<p class="sub-header">Organization vs Individual Ownership by Category</p>',
-            unsafe_allow_html=True,
-        )
 
-        col1, col2 = st.columns(2)
+@st.cache_data
+def get_standard_category(standards_exploded):
+    """Repository count per (category, standard) pair"""
+    return (
+        standards_exploded[["Category", "standards_list"]]
+        .value_counts(sort=False)
+        .reset_index(name="count")
+    )
 
-        with col1:
-            owner_type_by_cat = (
-                filtered_df.groupby(["Category", "owner_type"])
-                .size()
-                .reset_index(name="count")
-            )
-            fig_owner_stack = px.bar(
-                owner_type_by_cat,
-                x="Category",
-                y="count",
-                color="owner_type",
-                title="Repository Ownership Type by Category",
-                labels={"count": "Number of Repositories"},
-                barmode="stack",
-                color_discrete_map={"Organization": "#3498db", "Individual": "#e67e22"},
-            )
-            fig_owner_stack.update_layout(height=450)
-            st.plotly_chart(fig_owner_stack, use_container_width=True)
 
-        with col2:
-            # Percentage breakdown
-            owner_type_pct = (
-                filtered_df.groupby("Category")
-                .apply(
-                    lambda x: (x["owner_type"] == "Organization").sum() / len(x) * 100
-                )
-                .reset_index(name="org_percentage")
-            )
+@st.cache_data
+def get_standard_stars(standards_exploded):
+    """Average and total stars and repository count per standard"""
+    return (
+        standards_exploded.groupby("standards_list")
+        .agg(
+            **{
+                "Avg Stars": ("Stars", "mean"),
+                "Total Stars": ("Stars", "sum"),
+                "Repo Count": ("Stars", "size"),
+            }
+        )
+        .round(0)
+        .rename_axis("Standard")
+        .reset_index()
+        .sort_values("Avg Stars", ascending=False)
+    )
 
-            fig_owner_pct = px.bar(
-                owner_type_pct,
-                x="Category",
-                y="org_percentage",
-                title="Percentage of Repositories Owned by Organizations",
-                labels={"org_percentage": "Organization Ownership (%)"},
-                color="org_percentage",
-                color_continuous_scale="Blues",
-            )
-            fig_owner_pct.update_layout(height=450, yaxis=dict(range=[0, 100]))
-            st.plotly_chart(fig_owner_pct, use_container_width=True)
 
-        # Deep dive: Data Models & Validation
-        st.markdown(
-            '<p class="sub-header">🔍 Deep Dive: Data Models & Validation</p>',
-            unsafe_allow_html=True,
+# Figure builders
+#
+# Figures are cached as resources so unchanged charts skip Plotly's figure
+# construction and validation on every rerun. The first argument is the cache
+# key: the sidebar filter tuple (which fully determines filtered_df) plus any
+# chart-specific widget values. Underscore-prefixed data arguments are not
+# hashed by Streamlit, so callers must fold everything the data depends on
+# into the key.
+FIGURE_CACHE_ENTRIES = 256
+
+# Shared Plotly config for every chart: no Plotly logo in the mode bar
+PLOTLY_CFG = {"displaylogo": False, "responsive": True}
+
+# Most points drawn per line before it is downsampled
+LINE_MAX_POINTS = 2000
+
+
+def lttb_indices(x, y, n_out):
+    """Positions of n_out points that keep the visual shape of the (x, y) line,
+    picked with Largest-Triangle-Three-Buckets"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    # The first and last points are always kept; the rest are split into
+    # n_out - 2 buckets that each contribute one point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Keep the point forming the largest triangle with the last kept point
+        # and the average of the next bucket
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
         )
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_top_repos_bar(key, title, _repos_df, color_scale, hover_data, height):
+    """Horizontal bar chart of the most starred repositories"""
+    fig = px.bar(
+        _repos_df,
+        y="Repository",
+        x="Stars",
+        orientation="h",
+        title=title,
+        color="Stars",
+        color_continuous_scale=color_scale,
+        hover_data=list(hover_data),
+    )
+    fig.update_layout(
+        height=height, yaxis={"categoryorder": "total ascending"}, showlegend=False
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_top_repos_facets(key, _top_per_cat, categories):
+    """Most starred repositories of every category, one facet per category"""
+    fig = px.bar(
+        _top_per_cat,
+        y="Repository",
+        x="Stars",
+        orientation="h",
+        facet_col="Category",
+        facet_col_wrap=2,
+        facet_row_spacing=0.04,
+        # Leave room for the right-hand column's repository labels
+        facet_col_spacing=0.28,
+        category_orders={"Category": list(categories)},
+        hover_data=["Subcat", "Language"],
+    )
+    # Each facet gets its own repositories, star scale and color scale (one
+    # trace per facet, so each colors against its own star range)
+    fig.for_each_trace(lambda t: t.update(marker=dict(color=t.x, colorscale="Blues")))
+    fig.update_yaxes(
+        matches=None, showticklabels=True, categoryorder="total ascending", title=""
+    )
+    fig.update_xaxes(matches=None, showticklabels=True)
+    fig.for_each_annotation(
+        lambda a: a.update(text=f"Top 10 in {a.text.split('=', 1)[1]}")
+    )
+    fig.update_layout(height=400 * -(-len(categories) // 2), showlegend=False)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_donut_pie(key, title, _counts, height):
+    """Donut chart of value counts showing both count and percentage"""
+    fig = px.pie(
+        values=_counts.values,
+        names=_counts.index,
+        title=title,
+        hole=0.4,
+    )
+    fig.update_traces(
+        textposition="inside", texttemplate="%{label}<br>%{value} (%{percent})"
+    )
+    fig.update_layout(height=height)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_count_bar(key, title, _counts, x_label, y_label, color_scale, height):
+    """Horizontal bar chart of a count or sum series, largest at the top"""
+    # Horizontal bars are drawn bottom-up, so ascending rows put the largest on
+    # top; the stable sort keeps ties in their original order
+    bars = (
+        _counts.rename_axis(y_label)
+        .reset_index(name=x_label)
+        .sort_values(x_label, kind="stable")
+    )
+    fig = px.bar(
+        bars,
+        x=x_label,
+        y=y_label,
+        orientation="h",
+        title=title,
+        color=x_label,
+        color_continuous_scale=color_scale,
+    )
+    fig.update_layout(height=height)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_yearly_stack(key, title, _timeline, color):
+    """Stacked bar chart of repositories created per year"""
+    fig = px.bar(
+        _timeline,
+        x="year",
+        y="count",
+        color=color,
+        title=title,
+        labels={"count": "Number of Repositories", "year": "Year"},
+        barmode="stack",
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_subcat_activity(key, title, _subcat_activity):
+    """Stacked bar chart of active vs inactive repositories per subcategory"""
+    fig = px.bar(
+        _subcat_activity,
+        x="Subcat",
+        y="count",
+        color="recent_activity_category",
+        title=title,
+        labels={"count": "Number of Repositories"},
+        barmode="stack",
+        color_discrete_map={"Active": "#2ecc71", "Inactive": "#e74c3c"},
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_owner_stack(key, _owner_type_by_cat):
+    """Stacked bar chart of ownership type per category"""
+    fig = px.bar(
+        _owner_type_by_cat,
+        x="Category",
+        y="count",
+        color="owner_type",
+        title="Repository Ownership Type by Category",
+        labels={"count": "Number of Repositories"},
+        barmode="stack",
+        color_discrete_map={"Organization": "#3498db", "Individual": "#e67e22"},
+    )
+    fig.update_layout(height=450)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_owner_pct(key, _owner_type_pct):
+    """Bar chart of the share of organization-owned repositories per category"""
+    fig = px.bar(
+        _owner_type_pct,
+        x="Category",
+        y="org_percentage",
+        title="Percentage of Repositories Owned by Organizations",
+        labels={"org_percentage": "Organization Ownership (%)"},
+        color="org_percentage",
+        color_continuous_scale="Blues",
+    )
+    fig.update_layout(height=450, yaxis=dict(range=[0, 100]))
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_standard_category(key, _standard_category):
+    """Stacked bar chart of standards used per category"""
+    fig = px.bar(
+        _standard_category,
+        x="Category",
+        y="count",
+        color="standards_list",
+        title="Repository Count by Category and Standard",
+        labels={"count": "Number of Repositories", "standards_list": "Standard"},
+        barmode="stack",
+    )
+    fig.update_layout(height=450)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_standard_stars(key, _standard_stars):
+    """Horizontal bar chart of average stars per standard"""
+    fig = px.bar(
+        _standard_stars,
+        x="Avg Stars",
+        y="Standard",
+        orientation="h",
+        title="Average Stars by Standard",
+        color="Avg Stars",
+        color_continuous_scale="Blues",
+        hover_data=["Total Stars", "Repo Count"],
+    )
+    fig.update_layout(height=450, yaxis={"categoryorder": "total ascending"})
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_standard_box(key, _standards_exploded):
+    """Box plot of the stars distribution per standard"""
+    # Send five summary numbers per standard instead of every row
+    quantiles = (
+        _standards_exploded.groupby("standards_list", sort=False)["Stars"]
+        .quantile([0.0, 0.25, 0.5, 0.75, 1.0])
+        .unstack()
+    )
 
-        dm_validation_df = filtered_df[
-            (filtered_df["Category"] == "Data Models & Schemas")
-            | (filtered_df["Subcat"].str.contains("Validation", case=False, na=False))
+    fig = go.Figure(
+        data=[
+            go.Box(
+                x=[standard],
+                lowerfence=[q[0.0]],
+                q1=[q[0.25]],
+                median=[q[0.5]],
+                q3=[q[0.75]],
+                upperfence=[q[1.0]],
+                name=standard,
+            )
+            for standard, q in quantiles.iterrows()
         ]
+    )
 
-        if len(dm_validation_df) > 0:
-            col1, col2 = st.columns(2)
+    fig.update_layout(
+        title="Stars Distribution by Standard",
+        xaxis_title="Standard",
+        yaxis_title="Stars",
+        yaxis_type="log",
+        height=450,
+        showlegend=False,
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_standard_timeline(key, _standard_timeline):
+    """Line chart of cumulative repository adoption per standard"""
+    fig = px.line(
+        _standard_timeline,
+        x="Year",
+        y="cumulative_count",
+        color="Standard",
+        title="Cumulative Repository Adoption by Standard Over Time",
+        labels={"cumulative_count": "Total Repositories (Cumulative)"},
+        markers=True,
+    )
+    fig.update_layout(height=450)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_top_contributors(key, _top_contributors, metric, color_scale):
+    """Horizontal bar chart of the top contributors by the given metric"""
+    fig = px.bar(
+        _top_contributors,
+        x=metric,
+        y="Contributor",
+        orientation="h",
+        title=f"Top Contributors by {metric}",
+        color=metric,
+        color_continuous_scale=color_scale,
+        hover_data=_top_contributors.columns.tolist()[1:],
+    )
+    fig.update_layout(height=600, yaxis={"categoryorder": "total ascending"})
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_top_by_count(key, _top_by_count):
+    """Horizontal bar chart of the top contributors by repository count"""
+    fig = px.bar(
+        _top_by_count,
+        x="Repo Count",
+        y="Contributor",
+        orientation="h",
+        title="Top Contributors by Repository Count",
+        color="Repo Count",
+        color_continuous_scale="Greens",
+        hover_data=["Total Stars"],
+    )
+    fig.update_layout(height=600, yaxis={"categoryorder": "total ascending"})
+    return fig
 
-            with col1:
-                # Standards distribution in Data Models & Validation
-                dm_standards = dm_validation_df.explode("standards_list")
-                dm_standards = dm_standards[dm_standards["standards_list"].notna()]
-                dm_standards = dm_standards[
-                    dm_standards["standards_list"] != "None/Unknown"
-                ]
-
-                if len(dm_standards) > 0:
-                    dm_std_counts = dm_standards["standards_list"].value_counts()
-                    fig_dm_std = px.pie(
-                        values=dm_std_counts.values,
-                        names=dm_std_counts.index,
-                        title="Standards in Data Models & Validation",
-                        hole=0.4,
-                    )
-                    fig_dm_std.update_traces(
-                        textposition="inside",
-                        texttemplate="%{label}<br>%{value} (%{percent})",
-                    )
-                    fig_dm_std.update_layout(height=400)
-                    st.plotly_chart(fig_dm_std, use_container_width=True)
-                else:
-                    st.info(
-                        "No standard information available for Data Models & Validation."
-                    )
 
-            with col2:
-                # Language distribution in Data Models & Validation
-                dm_lang_counts = dm_validation_df["Language"].value_counts().head(10)
-                fig_dm_lang = px.pie(
-                    values=dm_lang_counts.values,
-                    names=dm_lang_counts.index,
-                    title="Languages in Data Models & Validation",
-                    hole=0.4,
-                )
-                fig_dm_lang.update_traces(
-                    textposition="inside",
-                    texttemplate="%{label}<br>%{value} (%{percent})",
-                )
-                fig_dm_lang.update_layout(height=400)
-                st.plotly_chart(fig_dm_lang, use_container_width=True)
-
-            # Top repositories in this subcategory
-            st.markdown("#### Top 10 Data Models & Validation Repositories")
-            dm_top = dm_validation_df.nlargest(10, "Stars")[
-                [
-                    "Repository",
-                    "Stars",
-                    "Language",
-                    "Standard",
-                    "recent_activity_category",
-                ]
-            ]
-            st.dataframe(dm_top, use_container_width=True)
-        else:
-            st.info("No repositories found in Data Models & Validation category.")
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_cumulative_growth(key, _filtered_df):
+    """Line chart of the cumulative number of repositories per category"""
+    df_sorted = _filtered_df[["Created", "Category"]].sort_values("Created")
+    df_sorted["cumulative_count"] = (
+        df_sorted.groupby("Category", sort=False, observed=True).cumcount() + 1
+    )
 
-    # TAB 3: Standards Analysis
-    with tab3:
-        st.markdown(
-            '<p class="sub-header">Data Standards Analysis</p>', unsafe_allow_html=True
+    # Thin out long category lines; each group's positions are in date order
+    if len(df_sorted) > LINE_MAX_POINTS:
+        x = df_sorted["Created"].to_numpy(dtype="int64").astype(float)
+        y = df_sorted["cumulative_count"].to_numpy(dtype=float)
+        positions = [
+            rows[lttb_indices(x[rows], y[rows], LINE_MAX_POINTS)]
+            for rows in df_sorted.groupby(
+                "Category", sort=False, observed=True
+            ).indices.values()
+        ]
+        df_sorted = df_sorted.iloc[np.sort(np.concatenate(positions))]
+
+    fig = px.line(
+        df_sorted,
+        x="Created",
+        y="cumulative_count",
+        color="Category",
+        category_orders={"Category": list(_filtered_df["Category"].cat.categories)},
+        render_mode="webgl",
+    )
+    fig.update_traces(line=dict(width=3))
+    fig.update_layout(
+        title="Cumulative Number of Repositories by Category Over Time",
+        xaxis_title="Date",
+        yaxis_title="Cumulative Number of Repositories",
+        height=600,
+        hovermode="closest",
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_survival_rate(key, _survival_by_year):
+    """Line chart of the survival rate per start year"""
+    fig = px.line(
+        _survival_by_year,
+        x="start_year",
+        y="survival_rate",
+        markers=True,
+        title="Repository Survival Rate by Start Year (%)",
+        labels={
+            "start_year": "Year Started",
+            "survival_rate": "Survival Rate (%)",
+        },
+    )
+    fig.update_layout(yaxis=dict(range=[0, 100]), height=400)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_survival_counts(key, _survival_by_year):
+    """Grouped bar chart of active vs total repositories per start year"""
+    fig = px.bar(
+        _survival_by_year,
+        x="start_year",
+        y=["active_repos", "total_repos"],
+        title="Active vs Total Repositories by Start Year",
+        labels={"value": "Number of Repos", "variable": "Status"},
+        barmode="group",
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_lifespan_timeline(key, title, _timeline_df, n_repos):
+    """Gantt-style chart of repository lifespans, colored by activity"""
+    # Create hover text with detailed info
+    hover_text = (
+        "<b>"
+        + _timeline_df["Repository"]
+        + "</b><br>Stars: "
+        + _timeline_df["Stars"].map("{:,}".format)
+        + "<br>Category: "
+        + _timeline_df["Category"].astype(str)
+        + "<br>Created: "
+        + _timeline_df["Created"].dt.strftime("%Y-%m-%d")
+        + "<br>Last Commit: "
+        + _timeline_df["Last Commit"].dt.strftime("%Y-%m-%d")
+        + "<br>Lifespan: "
+        + _timeline_df["lifespan_days"].astype(str)
+        + " days<br>Status: "
+        + _timeline_df["recent_activity_category"].astype(str)
+    )
+
+    # One trace per activity status; each repository is a creation -> last
+    # commit segment, separated from the next by a gap
+    traces = []
+    for status, line_color in (("Active", "#2ecc71"), ("Inactive", "#e74c3c")):
+        is_status = _timeline_df["recent_activity_category"] == status
+        repos = _timeline_df[is_status]
+        if len(repos) == 0:
+            continue
+
+        x = np.empty(len(repos) * 3, dtype="datetime64[ns]")
+        x[0::3] = repos["Created"].to_numpy()
+        x[1::3] = repos["Last Commit"].to_numpy()
+        x[2::3] = np.datetime64("NaT")
+        y = np.repeat(repos["Repository"].to_numpy(dtype=object), 3)
+        y[2::3] = None
+        text = np.repeat(hover_text[is_status].to_numpy(dtype=object), 3)
+        text[2::3] = None
+        # Circle at creation, square at the last commit
+        symbols = np.tile(["circle", "square", "circle"], len(repos))
+
+        traces.append(
+            go.Scattergl(
+                x=x,
+                y=y,
+                name=status,
+                mode="lines+markers",
+                line=dict(color=line_color, width=3),
+                marker=dict(size=8, symbol=symbols),
+                hovertext=text,
+                hoverinfo="text",
+                connectgaps=False,
+                showlegend=True,
+            )
         )
 
-        # Explode standards for individual counting
-        standards_exploded = filtered_df.explode("standards_list")
-        standards_exploded = standards_exploded[
-            standards_exploded["standards_list"].notna()
-        ]
-        standards_exploded = standards_exploded[
-            standards_exploded["standards_list"] != "None/Unknown"
-        ]
+    fig = go.Figure(data=traces)
+    fig.update_layout(
+        title=title,
+        xaxis_title="Date",
+        yaxis_title="Repository",
+        height=max(400, n_repos * 25),
+        hovermode="closest",
+        # Keep the repositories in the selected sort order
+        yaxis=dict(
+            tickmode="linear",
+            showgrid=True,
+            gridcolor="lightgray",
+            categoryorder="array",
+            categoryarray=_timeline_df["Repository"].tolist(),
+        ),
+        xaxis=dict(showgrid=True, gridcolor="lightgray"),
+        plot_bgcolor="white",
+    )
+    return fig
 
-        col1, col2 = st.columns(2)
 
-        with col1:
-            # Individual standards count (from exploded data)
-            standard_counts = standards_exploded["standards_list"].value_counts()
-            fig_std1 = px.pie(
-                values=standard_counts.values,
-                names=standard_counts.index,
-                title="Distribution of Individual Standards (repos may use multiple)",
-                hole=0.4,
-            )
-            fig_std1.update_traces(
-                textposition="inside", texttemplate="%{label}<br>%{value} (%{percent})"
-            )
-            fig_std1.update_layout(height=450)
-            st.plotly_chart(fig_std1, use_container_width=True)
+# Tab renderers
+# Each tab is a fragment, so widgets inside a tab only rerun that tab rather
+# than the whole script. Full reruns from the sidebar still render every tab.
 
-        with col2:
-            # Standards by repository count
-            fig_std2 = px.bar(
-                x=standard_counts.values,
-                y=standard_counts.index,
-                orientation="h",
-                title="Repository Count by Individual Standard",
-                labels={"x": "Number of Repositories", "y": "Standard"},
-                color=standard_counts.values,
-                color_continuous_scale="Teal",
-            )
-            fig_std2.update_layout(
-                height=450, yaxis={"categoryorder": "total ascending"}
-            )
-            st.plotly_chart(fig_std2, use_container_width=True)
 
-        # Standards by Category
-        st.markdown(
-            '<p class="sub-header">Standards Adoption by Category</p>',
-            unsafe_allow_html=True,
-        )
+@st.fragment
+def render_top_repositories_tab(filtered_df, filter_key):
+    """Render the Top Repositories tab"""
+    st.markdown(
+        '<p class="sub-header">Top Starred Repositories by Category</p>',
+        unsafe_allow_html=True,
+    )
 
-        # Stacked bar chart
-        standard_category = (
-            standards_exploded.groupby(["Category", "standards_list"])
-            .size()
-            .reset_index(name="count")
+    # Get categories to display
+    categories_to_show = observed_categories(filtered_df["Category"])
+    top_per_cat = get_top_per_category(filtered_df)
+
+    # One faceted chart, two categories per row
+    if len(top_per_cat) > 0:
+        fig = build_top_repos_facets(filter_key, top_per_cat, tuple(categories_to_show))
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CFG)
+
+    # Special highlight: Interoperability
+    st.markdown(
+        '<p class="sub-header">🌟 Spotlight: Top 10 Interoperability Projects</p>',
+        unsafe_allow_html=True,
+    )
+
+    interop_df = filtered_df[filtered_df["Category"] == "Interoperability"].nlargest(
+        10, "Stars"
+    )
+
+    if len(interop_df) > 0:
+        fig_interop = build_top_repos_bar(
+            filter_key,
+            "Most Starred Interoperability Projects",
+            interop_df,
+            "Viridis",
+            ("Subcat", "Language", "Standard"),
+            500,
         )
-        fig_std4 = px.bar(
-            standard_category,
-            x="Category",
-            y="count",
-            color="standards_list",
-            title="Repository Count by Category and Standard",
-            labels={"count": "Number of Repositories", "standards_list": "Standard"},
-            barmode="stack",
+        st.plotly_chart(fig_interop, use_container_width=True, config=PLOTLY_CFG)
+
+        # Show detailed table
+        st.markdown("#### Detailed Information")
+        display_cols = [
+            "Repository",
+            "Stars",
+            "Subcat",
+            "Language",
+            "Standard",
+            "recent_activity_category",
+        ]
+        st.dataframe(
+            interop_df[display_cols].sort_values("Stars", ascending=False),
+            use_container_width=True,
+            height=400,
         )
-        fig_std4.update_layout(height=450)
-        st.plotly_chart(fig_std4, use_container_width=True)
+    else:
+        st.info("No Interoperability repositories in the current selection.")
 
-        # Standards and Stars correlation
-        st.markdown(
-            '<p class="sub-header">Standards and Repository Popularity</p>',
-            unsafe_allow_html=True,
-        )
 
-        col1, col2 = st.columns(2)
+@st.fragment
+def render_category_tab(filtered_df, filter_key):
+    """Render the Category Analysis tab"""
+    st.markdown('<p class="sub-header">Category Overview</p>', unsafe_allow_html=True)
 
-        with col1:
-            # Average stars by standard
-            standard_stars = (
-                standards_exploded.groupby("standards_list")
-                .agg({"Stars": ["mean", "sum", "count"]})
-                .round(0)
-            )
-            standard_stars.columns = ["Avg Stars", "Total Stars", "Repo Count"]
-            standard_stars = standard_stars.reset_index().sort_values(
-                "Avg Stars", ascending=False
-            )
-            standard_stars.columns = [
-                "Standard",
-                "Avg Stars",
-                "Total Stars",
-                "Repo Count",
-            ]
+    col1, col2 = st.columns(2)
 
-            fig_std5 = px.bar(
-                standard_stars,
-                x="Avg Stars",
-                y="Standard",
-                orientation="h",
-                title="Average Stars by Standard",
-                color="Avg Stars",
-                color_continuous_scale="Blues",
-                hover_data=["Total Stars", "Repo Count"],
-            )
-            fig_std5.update_layout(
-                height=450, yaxis={"categoryorder": "total ascending"}
-            )
-            st.plotly_chart(fig_std5, use_container_width=True)
+    with col1:
+        # Category counts with numbers
+        category_counts = get_category_counts(filtered_df)
+        fig_cat_pie = build_donut_pie(
+            filter_key, "Repository Distribution by Category", category_counts, 450
+        )
+        st.plotly_chart(fig_cat_pie, use_container_width=True, config=PLOTLY_CFG)
 
-        with col2:
-            # Box plot of stars distribution by standard
-            fig_std6 = px.box(
-                standards_exploded,
-                x="standards_list",
-                y="Stars",
-                title="Stars Distribution by Standard",
-                color="standards_list",
-                log_y=True,
-                labels={"standards_list": "Standard"},
-            )
-            fig_std6.update_layout(height=450, showlegend=False)
-            st.plotly_chart(fig_std6, use_container_width=True)
+    with col2:
+        # Language distribution with numbers
+        language_counts = get_language_counts(filtered_df)
+        fig_lang_pie = build_donut_pie(
+            filter_key, "Top 10 Programming Languages", language_counts, 450
+        )
+        st.plotly_chart(fig_lang_pie, use_container_width=True, config=PLOTLY_CFG)
 
-        # Standards adoption over time
-        st.markdown(
-            '<p class="sub-header">Standards Adoption Timeline</p>',
-            unsafe_allow_html=True,
+    # Stacked bar chart: Categories over time
+    st.markdown(
+        '<p class="sub-header">Category Growth Over Time</p>',
+        unsafe_allow_html=True,
+    )
+
+    category_timeline = get_category_timeline(filtered_df)
+
+    fig_cat_timeline = build_yearly_stack(
+        filter_key,
+        "Repository Creation by Category Over Time",
+        category_timeline,
+        "Category",
+    )
+    st.plotly_chart(fig_cat_timeline, use_container_width=True, config=PLOTLY_CFG)
+
+    # Subcategory Explorer
+    st.markdown(
+        '<p class="sub-header">Subcategory Explorer</p>', unsafe_allow_html=True
+    )
+
+    selected_category_explorer = st.selectbox(
+        "Select a category to explore subcategories:",
+        options=["All Categories"] + observed_categories(filtered_df["Category"]),
+    )
+
+    if selected_category_explorer == "All Categories":
+        explorer_df = filtered_df
+    else:
+        explorer_df = filtered_df[filtered_df["Category"] == selected_category_explorer]
+
+    # Stacked bar chart: Categories over time
+    st.markdown(
+        '<p class="sub-header">Subcategory Growth Over Time</p>',
+        unsafe_allow_html=True,
+    )
+
+    subcategory_timeline = (
+        explorer_df.groupby(
+            [pd.Grouper(key="Created", freq="Y"), "Subcat"], observed=True
         )
+        .size()
+        .reset_index(name="count")
+    )
+    subcategory_timeline["year"] = subcategory_timeline["Created"].dt.year
 
-        standard_timeline = (
-            standards_exploded.groupby(
-                [pd.Grouper(key="first_commit", freq="Y"), "standards_list"]
-            )
-            .size()
+    fig_subcat_timeline = build_yearly_stack(
+        filter_key + (selected_category_explorer,),
+        "Repository Creation by Subcategory Over Time",
+        subcategory_timeline,
+        "Subcat",
+    )
+    st.plotly_chart(fig_subcat_timeline, use_container_width=True, config=PLOTLY_CFG)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Subcategory distribution
+        subcat_counts = observed_value_counts(explorer_df["Subcat"])
+
+        fig_subcat = build_count_bar(
+            filter_key,
+            f"Subcategory Distribution - {selected_category_explorer}",
+            subcat_counts,
+            "Number of Repositories",
+            "Subcategory",
+            "Teal",
+            500,
+        )
+        st.plotly_chart(fig_subcat, use_container_width=True, config=PLOTLY_CFG)
+
+    with col2:
+        # Subcategory by activity
+        subcat_activity = (
+            explorer_df[["Subcat", "recent_activity_category"]]
+            .value_counts(sort=False)
             .reset_index(name="count")
         )
-        standard_timeline["first_commit"] = standard_timeline["first_commit"].dt.year
-        standard_timeline.columns = ["Year", "Standard", "count"]
-
-        # Calculate cumulative sum for each standard
-        standard_timeline = standard_timeline.sort_values("Year")
-        standard_timeline["cumulative_count"] = standard_timeline.groupby("Standard")[
-            "count"
-        ].cumsum()
-
-        fig_std7 = px.line(
-            standard_timeline,
-            x="Year",
-            y="cumulative_count",
-            color="Standard",
-            title="Cumulative Repository Adoption by Standard Over Time",
-            labels={"cumulative_count": "Total Repositories (Cumulative)"},
-            markers=True,
+        fig_subcat_activity = build_subcat_activity(
+            filter_key,
+            f"Subcategory Activity Status - {selected_category_explorer}",
+            subcat_activity,
+        )
+        st.plotly_chart(
+            fig_subcat_activity, use_container_width=True, config=PLOTLY_CFG
         )
-        fig_std7.update_layout(height=450)
-        st.plotly_chart(fig_std7, use_container_width=True)
 
-    # TAB 4: Top Contributors
-    with tab4:
-        st.markdown(
-            '<p class="sub-header">Top Contributors Explorer</p>',
-            unsafe_allow_html=True,
+    # Organization vs Individual breakdown by category
+    st.markdown(
+        '<p class="sub-header">Organization vs Individual Ownership by Category</p>',
+        unsafe_allow_html=True,
+    )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        owner_type_by_cat = get_owner_type_by_category(filtered_df)
+        fig_owner_stack = build_owner_stack(filter_key, owner_type_by_cat)
+        st.plotly_chart(fig_owner_stack, use_container_width=True, config=PLOTLY_CFG)
+
+    with col2:
+        # Percentage breakdown
+        owner_type_pct = (
+            filtered_df["owner_type"]
+            .eq("Organization")
+            .groupby(filtered_df["Category"], observed=True)
+            .mean()
+            .mul(100)
+            .reset_index(name="org_percentage")
         )
 
-        # Extract all contributors (filtering out bots)
-        contributors_list = []
-        for idx, row in filtered_df.iterrows():
-            if pd.notna(row["Top Contributors"]):
-                contributors = str(row["Top Contributors"]).split(", ")
-                for contributor in contributors:
-                    contributor_clean = contributor.strip()
-                    # Filter out bots
-                    if contributor_clean.lower() not in [
-                        bot.lower() for bot in BOT_ACCOUNTS
-                    ]:
-                        contributors_list.append(
-                            {
-                                "Contributor": contributor_clean,
-                                "Repository": row["Repository"],
-                                "Stars": row["Stars"],
-                                "Category": row["Category"],
-                                "Org": row["Org"],
-                                "Active": row["recent_activity_category"],
-                                "Standard": row.get("Standard", "None/Unknown"),
-                            }
-                        )
+        fig_owner_pct = build_owner_pct(filter_key, owner_type_pct)
+        st.plotly_chart(fig_owner_pct, use_container_width=True, config=PLOTLY_CFG)
 
-        contributors_df = pd.DataFrame(contributors_list)
+    # Deep dive: Data Models & Validation
+    st.markdown(
+        '<p class="sub-header">🔍 Deep Dive: Data Models & Validation</p>',
+        unsafe_allow_html=True,
+    )
 
-        if len(contributors_df) > 0:
-            # Merge with contribution statistics if available
-            if contrib_stats is not None:
-                st.info(
-                    "📊 Using detailed contribution statistics (lines of code) for ranking."
-                )
+    dm_validation_df = filtered_df[
+        (filtered_df["Category"] == "Data Models & Schemas")
+        | (filtered_df["Subcat"].str.contains("Validation", case=False, na=False))
+    ]
 
-                # Merge contributors with their stats
-                contributors_with_stats = contributors_df.merge(
-                    contrib_stats[
-                        [
-                            "username",
-                            "total_additions",
-                            "total_commits",
-                            "total_net_lines",
-                        ]
-                    ],
-                    left_on="Contributor",
-                    right_on="username",
-                    how="left",
-                )
+    if len(dm_validation_df) > 0:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Standards distribution in Data Models & Validation
+            standards_exploded = get_filtered_standards(*filter_key)
+            dm_standards = standards_exploded[
+                standards_exploded.index.isin(dm_validation_df.index)
+            ]
 
-                # Fill NaN with 0 for contributors without stats
-                contributors_with_stats["total_additions"] = contributors_with_stats[
-                    "total_additions"
-                ].fillna(0)
-                contributors_with_stats["total_commits"] = contributors_with_stats[
-                    "total_commits"
-                ].fillna(0)
-                contributors_with_stats["total_net_lines"] = contributors_with_stats[
-                    "total_net_lines"
-                ].fillna(0)
-
-                # Aggregate by contributor
-                top_contributors = (
-                    contributors_with_stats.groupby("Contributor")
-                    .agg(
-                        {
-                            "total_additions": "first",
-                            "total_commits": "first",
-                            "Stars": "sum",
-                            "Repository": "count",
-                        }
-                    )
-                    .reset_index()
+            if len(dm_standards) > 0:
+                dm_std_counts = dm_standards["standards_list"].value_counts()
+                fig_dm_std = build_donut_pie(
+                    filter_key,
+                    "Standards in Data Models & Validation",
+                    dm_std_counts,
+                    400,
                 )
-                top_contributors.columns = [
-                    "Contributor",
-                    "Lines Added",
-                    "Total Commits",
-                    "Total Stars",
-                    "Repo Count",
-                ]
-                top_contributors = top_contributors.sort_values(
-                    "Lines Added", ascending=False
-                ).head(20)
-
-                metric_for_chart = "Lines Added"
-                color_scale = "Viridis"
+                st.plotly_chart(fig_dm_std, use_container_width=True, config=PLOTLY_CFG)
             else:
-                st.warning(
-                    "⚠️ Contribution statistics not available. Using stars for ranking."
+                st.info(
+                    "No standard information available for Data Models & Validation."
                 )
 
-                # Fallback to stars-based ranking
-                top_contributors = (
-                    contributors_df.groupby("Contributor")
-                    .agg({"Stars": "sum", "Repository": "count"})
-                    .reset_index()
-                )
-                top_contributors.columns = ["Contributor", "Total Stars", "Repo Count"]
-                top_contributors = top_contributors.sort_values(
-                    "Total Stars", ascending=False
-                ).head(20)
+        with col2:
+            # Language distribution in Data Models & Validation
+            dm_lang_counts = get_language_counts(dm_validation_df)
+
+            fig_dm_lang = build_donut_pie(
+                filter_key,
+                "Languages in Data Models & Validation",
+                dm_lang_counts,
+                400,
+            )
+            st.plotly_chart(fig_dm_lang, use_container_width=True, config=PLOTLY_CFG)
 
-                metric_for_chart = "Total Stars"
-                color_scale = "Blues"
+        # Top repositories in this subcategory
+        st.markdown("#### Top 10 Data Models & Validation Repositories")
+        dm_top = dm_validation_df.nlargest(10, "Stars")[
+            [
+                "Repository",
+                "Stars",
+                "Language",
+                "Standard",
+                "recent_activity_category",
+            ]
+        ]
+        st.dataframe(dm_top, use_container_width=True)
+    else:
+        st.info("No repositories found in Data Models & Validation category.")
 
-            col1, col2 = st.columns(2)
 
-            with col1:
-                st.markdown(f"#### Top 20 Contributors by {metric_for_chart}")
-                st.markdown(f"#### Top 20 Contributors by {metric_for_chart}")
-                fig7 = px.bar(
-                    top_contributors,
-                    x=metric_for_chart,
-                    y="Contributor",
-                    orientation="h",
-                    title=f"Top Contributors by {metric_for_chart}",
-                    color=metric_for_chart,
-                    color_continuous_scale=color_scale,
-                    hover_data=top_contributors.columns.tolist()[1:],
-                )
-                fig7.update_layout(
-                    height=600, yaxis={"categoryorder": "total ascending"}
-                )
-                st.plotly_chart(fig7, use_container_width=True)
+@st.fragment
+def render_standards_tab(filter_key):
+    """Render the Standards Analysis tab"""
+    st.markdown(
+        '<p class="sub-header">Data Standards Analysis</p>', unsafe_allow_html=True
+    )
 
-            with col2:
-                st.markdown("#### Top 20 Contributors by Repository Count")
-                top_by_count = (
-                    contributors_df.groupby("Contributor")
-                    .agg({"Repository": "count", "Stars": "sum"})
-                    .reset_index()
-                )
-                top_by_count.columns = ["Contributor", "Repo Count", "Total Stars"]
-                top_by_count = top_by_count.sort_values(
-                    "Repo Count", ascending=False
-                ).head(20)
-
-                fig8 = px.bar(
-                    top_by_count,
-                    x="Repo Count",
-                    y="Contributor",
-                    orientation="h",
-                    title="Top Contributors by Repository Count",
-                    color="Repo Count",
-                    color_continuous_scale="Greens",
-                    hover_data=["Total Stars"],
-                )
-                fig8.update_layout(
-                    height=600, yaxis={"categoryorder": "total ascending"}
-                )
-                st.plotly_chart(fig8, use_container_width=True)
+    # One row per (standard, repository) for individual counting
+    standards_exploded = get_filtered_standards(*filter_key)
 
-            # Contributor search
-            st.markdown(
-                '<p class="sub-header">Search Contributor</p>', unsafe_allow_html=True
-            )
-            search_contributor = st.selectbox(
-                "Select a contributor to view details:",
-                options=sorted(contributors_df["Contributor"].unique()),
-            )
+    col1, col2 = st.columns(2)
 
-            if search_contributor:
-                contributor_repos = contributors_df[
-                    contributors_df["Contributor"] == search_contributor
-                ]
-
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Total Repositories", len(contributor_repos))
-                with col2:
-                    st.metric("Total Stars", f"{contributor_repos['Stars'].sum():,}")
-                with col3:
-                    active_count = len(
-                        contributor_repos[contributor_repos["Active"] == "Active"]
-                    )
-                    st.metric("Active Repositories", active_count)
-                with col4:
-                    if contrib_stats is not None:
-                        user_contrib = contrib_stats[
-                            contrib_stats["username"] == search_contributor
-                        ]
-                        if len(user_contrib) > 0:
-                            st.metric(
-                                "Lines Added",
-                                f"{int(user_contrib['total_additions'].values[0]):,}",
-                            )
-                        else:
-                            st.metric("Lines Added", "N/A")
-
-                st.markdown("#### Repositories")
-                display_repos = contributor_repos[
-                    ["Repository", "Stars", "Category", "Standard", "Org", "Active"]
-                ].sort_values("Stars", ascending=False)
-                st.dataframe(display_repos, use_container_width=True, height=200)
-
-        # Top Organizations (excluding standard organizations)
-        st.markdown(
-            '<p class="sub-header">Top Organizations</p>', unsafe_allow_html=True
+    with col1:
+        # Individual standards count (from exploded data)
+        standard_counts = get_standard_counts(standards_exploded)
+        fig_std1 = build_donut_pie(
+            filter_key,
+            "Distribution of Individual Standards (repos may use multiple)",
+            standard_counts,
+            450,
         )
+        st.plotly_chart(fig_std1, use_container_width=True, config=PLOTLY_CFG)
 
-        # Filter out standard organizations
-        # org_filtered_df = filtered_df[~filtered_df['Org'].isin(STANDARD_ORGS_TO_EXCLUDE)]
-        org_filtered_df = filtered_df[filtered_df["is_organization"] == True]
+    with col2:
+        # Standards by repository count
+        fig_std2 = build_count_bar(
+            filter_key,
+            "Repository Count by Individual Standard",
+            standard_counts,
+            "Number of Repositories",
+            "Standard",
+            "Teal",
+            450,
+        )
+        st.plotly_chart(fig_std2, use_container_width=True, config=PLOTLY_CFG)
 
-        col1, col2 = st.columns(2)
+    # Standards by Category
+    st.markdown(
+        '<p class="sub-header">Standards Adoption by Category</p>',
+        unsafe_allow_html=True,
+    )
 
-        with col1:
-            org_stars = (
-                org_filtered_df.groupby("Org")["Stars"]
-                .sum()
-                .sort_values(ascending=False)
-                .head(15)
-            )
-            fig9 = px.bar(
-                x=org_stars.values,
-                y=org_stars.index,
-                orientation="h",
-                title="Top 15 Organizations by Total Stars",
-                labels={"x": "Total Stars", "y": "Organization"},
-                color=org_stars.values,
-                color_continuous_scale="Oranges",
-            )
-            fig9.update_layout(height=500, yaxis={"categoryorder": "total ascending"})
-            st.plotly_chart(fig9, use_container_width=True)
+    # Stacked bar chart
+    standard_category = get_standard_category(standards_exploded)
 
-        with col2:
-            org_count = (
-                org_filtered_df.groupby("Org")["Repository"]
-                .count()
-                .sort_values(ascending=False)
-                .head(15)
+    fig_std4 = build_standard_category(filter_key, standard_category)
+    st.plotly_chart(fig_std4, use_container_width=True, config=PLOTLY_CFG)
+
+    # Standards and Stars correlation
+    st.markdown(
+        '<p class="sub-header">Standards and Repository Popularity</p>',
+        unsafe_allow_html=True,
+    )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Average stars by standard
+        standard_stars = get_standard_stars(standards_exploded)
+
+        fig_std5 = build_standard_stars(filter_key, standard_stars)
+        st.plotly_chart(fig_std5, use_container_width=True, config=PLOTLY_CFG)
+
+    with col2:
+        # Box plot of stars distribution by standard
+        fig_std6 = build_standard_box(filter_key, standards_exploded)
+        st.plotly_chart(fig_std6, use_container_width=True, config=PLOTLY_CFG)
+
+    # Standards adoption over time
+    st.markdown(
+        '<p class="sub-header">Standards Adoption Timeline</p>',
+        unsafe_allow_html=True,
+    )
+
+    standard_timeline = (
+        standards_exploded.groupby(
+            [pd.Grouper(key="Created", freq="Y"), "standards_list"]
+        )
+        .size()
+        .reset_index(name="count")
+    )
+    standard_timeline["Created"] = standard_timeline["Created"].dt.year
+    standard_timeline.columns = ["Year", "Standard", "count"]
+
+    # Calculate cumulative sum for each standard
+    standard_timeline = standard_timeline.sort_values("Year")
+    standard_timeline["cumulative_count"] = standard_timeline.groupby(
+        "Standard", sort=False
+    )["count"].cumsum()
+
+    fig_std7 = build_standard_timeline(filter_key, standard_timeline)
+    st.plotly_chart(fig_std7, use_container_width=True, config=PLOTLY_CFG)
+
+
+@st.fragment
+def render_contributors_tab(filtered_df, filter_key, contrib_stats):
+    """Render the Top Contributors tab"""
+    st.markdown(
+        '<p class="sub-header">Top Contributors Explorer</p>',
+        unsafe_allow_html=True,
+    )
+
+    contributors_df = get_filtered_contributors(*filter_key)
+
+    if len(contributors_df) > 0:
+        contributor_totals = get_contributor_totals(contributors_df, contrib_stats)
+
+        # Rank by lines of code when contribution statistics are available
+        if contrib_stats is not None:
+            st.info(
+                "📊 Using detailed contribution statistics (lines of code) for ranking."
             )
-            fig10 = px.bar(
-                x=org_count.values,
-                y=org_count.index,
-                orientation="h",
-                title="Top 15 Organizations by Repository Count",
-                labels={"x": "Repository Count", "y": "Organization"},
-                color=org_count.values,
-                color_continuous_scale="Purples",
+
+            metric_for_chart = "Lines Added"
+            color_scale = "Viridis"
+        else:
+            st.warning(
+                "⚠️ Contribution statistics not available. Using stars for ranking."
             )
-            fig10.update_layout(height=500, yaxis={"categoryorder": "total ascending"})
-            st.plotly_chart(fig10, use_container_width=True)
 
-        personal_filtered_df = filtered_df[filtered_df["is_organization"] == False]
+            # Fallback to stars-based ranking
+            metric_for_chart = "Total Stars"
+            color_scale = "Blues"
+
+        top_contributors = contributor_totals.nlargest(
+            20, metric_for_chart
+        ).reset_index()
 
         col1, col2 = st.columns(2)
 
         with col1:
-            org_stars = (
-                personal_filtered_df.groupby("Org")["Stars"]
-                .sum()
-                .sort_values(ascending=False)
-                .head(15)
-            )
-            fig9_personal = px.bar(
-                x=org_stars.values,
-                y=org_stars.index,
-                orientation="h",
-                title="Top 15 Individuals by Total Stars",
-                labels={"x": "Total Stars", "y": "Organization"},
-                color=org_stars.values,
-                color_continuous_scale="Oranges",
-            )
-            fig9_personal.update_layout(
-                height=500, yaxis={"categoryorder": "total ascending"}
+            st.markdown(f"#### Top 20 Contributors by {metric_for_chart}")
+            st.markdown(f"#### Top 20 Contributors by {metric_for_chart}")
+            fig7 = build_top_contributors(
+                filter_key, top_contributors, metric_for_chart, color_scale
             )
-            st.plotly_chart(fig9_personal, use_container_width=True)
+            st.plotly_chart(fig7, use_container_width=True, config=PLOTLY_CFG)
 
         with col2:
-            org_count = (
-                personal_filtered_df.groupby("Org")["Repository"]
-                .count()
-                .sort_values(ascending=False)
-                .head(15)
-            )
-            fig10_personal = px.bar(
-                x=org_count.values,
-                y=org_count.index,
-                orientation="h",
-                title="Top 15 Individuals by Repository Count",
-                labels={"x": "Repository Count", "y": "Organization"},
-                color=org_count.values,
-                color_continuous_scale="Purples",
-            )
-            fig10_personal.update_layout(
-                height=500, yaxis={"categoryorder": "total ascending"}
-            )
-            st.plotly_chart(fig10_personal, use_container_width=True)
+            st.markdown("#### Top 20 Contributors by Repository Count")
+            top_by_count = contributor_totals.nlargest(20, "Repo Count").reset_index()
 
-    # TAB 5: Temporal Analysis
-    with tab5:
+            fig8 = build_top_by_count(filter_key, top_by_count)
+            st.plotly_chart(fig8, use_container_width=True, config=PLOTLY_CFG)
+
+        # Contributor search
         st.markdown(
-            '<p class="sub-header">Repository Growth Over Time</p>',
-            unsafe_allow_html=True,
+            '<p class="sub-header">Search Contributor</p>', unsafe_allow_html=True
+        )
+        contributor_index, contributor_options = get_contributor_index(contributors_df)
+        search_contributor = st.selectbox(
+            "Select a contributor to view details:",
+            options=contributor_options,
         )
 
-        # Cumulative repositories by category
-        df_sorted = filtered_df.sort_values("first_commit")
-        categories = filtered_df["Category"].unique()
+        if search_contributor:
+            contributor_repos = contributor_index.loc[[search_contributor]]
 
-        fig11 = go.Figure()
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Total Repositories", len(contributor_repos))
+            with col2:
+                st.metric("Total Stars", f"{contributor_repos['Stars'].sum():,}")
+            with col3:
+                active_count = int((contributor_repos["Active"] == "Active").sum())
+                st.metric("Active Repositories", active_count)
+            with col4:
+                if contrib_stats is not None:
+                    try:
+                        lines_added = int(
+                            contrib_stats.at[search_contributor, "total_additions"]
+                        )
+                        st.metric("Lines Added", f"{lines_added:,}")
+                    except KeyError:
+                        st.metric("Lines Added", "N/A")
+
+            st.markdown("#### Repositories")
+            display_repos = contributor_repos[
+                ["Repository", "Stars", "Category", "Standard", "Org", "Active"]
+            ].sort_values("Stars", ascending=False)
+            st.dataframe(
+                display_repos, use_container_width=True, height=200, hide_index=True
+            )
 
-        for category in categories:
-            category_df = df_sorted[df_sorted["Category"] == category].copy()
-            category_df["cumulative_count"] = range(1, len(category_df) + 1)
+    # Top Organizations (excluding standard organizations)
+    st.markdown('<p class="sub-header">Top Organizations</p>', unsafe_allow_html=True)
 
-            fig11.add_trace(
-                go.Scatter(
-                    x=category_df["first_commit"],
-                    y=category_df["cumulative_count"],
-                    mode="lines",
-                    name=category,
-                    line=dict(width=3),
-                )
-            )
+    # Filter out standard organizations
+    # org_filtered_df = filtered_df[~filtered_df['Org'].isin(STANDARD_ORGS_TO_EXCLUDE)]
+    org_filtered_df = filtered_df[filtered_df["is_organization"] == True]
+
+    col1, col2 = st.columns(2)
+
+    org_stars, org_count = get_org_top(org_filtered_df)
 
-        fig11.update_layout(
-            title="Cumulative Number of Repositories by Category Over Time",
-            xaxis_title="Date",
-            yaxis_title="Cumulative Number of Repositories",
-            height=600,
-            hovermode="closest",
+    with col1:
+        fig9 = build_count_bar(
+            filter_key,
+            "Top 15 Organizations by Total Stars",
+            org_stars,
+            "Total Stars",
+            "Organization",
+            "Oranges",
+            500,
         )
-        st.plotly_chart(fig11, use_container_width=True)
+        st.plotly_chart(fig9, use_container_width=True, config=PLOTLY_CFG)
 
-        # Survival rate analysis
-        st.markdown(
-            '<p class="sub-header">Repository Survival Analysis</p>',
-            unsafe_allow_html=True,
+    with col2:
+        fig10 = build_count_bar(
+            filter_key,
+            "Top 15 Organizations by Repository Count",
+            org_count,
+            "Repository Count",
+            "Organization",
+            "Purples",
+            500,
         )
+        st.plotly_chart(fig10, use_container_width=True, config=PLOTLY_CFG)
 
-        with st.expander("Survival Rate Definition"):
-            st.markdown(
-                """
-            The survival rate represents the percentage of repositories created in a given year
-            that are still "active" today. A repository is considered active if it has had at least one commit within the last 365 days.
-            """
-            )
+    personal_filtered_df = filtered_df[filtered_df["is_organization"] == False]
+
+    col1, col2 = st.columns(2)
+
+    personal_stars, personal_count = get_org_top(personal_filtered_df)
 
-        survival_by_year = (
-            filtered_df.groupby("start_year")
-            .agg({"is_active": ["sum", "count"]})
-            .round(3)
+    with col1:
+        fig9_personal = build_count_bar(
+            filter_key,
+            "Top 15 Individuals by Total Stars",
+            personal_stars,
+            "Total Stars",
+            "Organization",
+            "Oranges",
+            500,
         )
-        survival_by_year.columns = ["active_repos", "total_repos"]
-        survival_by_year["survival_rate"] = (
-            survival_by_year["active_repos"] / survival_by_year["total_repos"] * 100
-        ).round(1)
-        survival_by_year = survival_by_year.reset_index()
+        st.plotly_chart(fig9_personal, use_container_width=True, config=PLOTLY_CFG)
 
-        col1, col2 = st.columns(2)
+    with col2:
+        fig10_personal = build_count_bar(
+            filter_key,
+            "Top 15 Individuals by Repository Count",
+            personal_count,
+            "Repository Count",
+            "Organization",
+            "Purples",
+            500,
+        )
+        st.plotly_chart(fig10_personal, use_container_width=True, config=PLOTLY_CFG)
 
-        with col1:
-            fig12 = px.line(
-                survival_by_year,
-                x="start_year",
-                y="survival_rate",
-                markers=True,
-                title="Repository Survival Rate by Start Year (%)",
-                labels={
-                    "start_year": "Year Started",
-                    "survival_rate": "Survival Rate (%)",
-                },
-            )
-            fig12.update_layout(yaxis=dict(range=[0, 100]), height=400)
-            st.plotly_chart(fig12, use_container_width=True)
 
-        with col2:
-            fig13 = px.bar(
-                survival_by_year,
-                x="start_year",
-                y=["active_repos", "total_repos"],
-                title="Active vs Total Repositories by Start Year",
-                labels={"value": "Number of Repos", "variable": "Status"},
-                barmode="group",
-            )
-            fig13.update_layout(height=400)
-            st.plotly_chart(fig13, use_container_width=True)
+@st.fragment
+def render_temporal_tab(filtered_df, filter_key):
+    """Render the Temporal Analysis tab"""
+    st.markdown(
+        '<p class="sub-header">Repository Growth Over Time</p>',
+        unsafe_allow_html=True,
+    )
+
+    # Cumulative repositories by category
+    fig11 = build_cumulative_growth(filter_key, filtered_df)
+    st.plotly_chart(fig11, use_container_width=True, config=PLOTLY_CFG)
 
-        # Repository Timeline View
+    # Survival rate analysis
+    st.markdown(
+        '<p class="sub-header">Repository Survival Analysis</p>',
+        unsafe_allow_html=True,
+    )
+
+    with st.expander("Survival Rate Definition"):
         st.markdown(
-            '<p class="sub-header">Repository Timeline View</p>', unsafe_allow_html=True
+            """
+        The survival rate represents the percentage of repositories created in a given year
+        that are still "active" today. A repository is considered active if it has had at least one commit within the last 365 days.
+        """
         )
 
-        # Selection controls
-        col1, col2, col3 = st.columns([2, 2, 1])
+    survival_by_year = get_survival_by_year(filtered_df)
+
+    if survival_by_year.empty:
+        st.info("No creation dates available for the selected filters.")
+    else:
+        col1, col2 = st.columns(2)
 
         with col1:
-            timeline_category = st.selectbox(
-                "Select Category for Timeline",
-                options=["All"] + sorted(filtered_df["Category"].unique().tolist()),
-                key="timeline_category",
-            )
+            fig12 = build_survival_rate(filter_key, survival_by_year)
+            st.plotly_chart(fig12, use_container_width=True, config=PLOTLY_CFG)
 
         with col2:
-            sort_option = st.selectbox(
-                "Sort repositories by",
-                options=[
-                    "Stars (High to Low)",
-                    "Stars (Low to High)",
-                    "Lifespan (Longest)",
-                    "Lifespan (Shortest)",
-                    "Most Recent",
-                    "Oldest",
-                ],
-                key="timeline_sort",
-            )
+            fig13 = build_survival_counts(filter_key, survival_by_year)
+            st.plotly_chart(fig13, use_container_width=True, config=PLOTLY_CFG)
 
+    # Repository Timeline View
+    st.markdown(
+        '<p class="sub-header">Repository Timeline View</p>', unsafe_allow_html=True
+    )
+
+    # Selection controls
+    col1, col2, col3 = st.columns([2, 2, 1])
+
+    with col1:
+        timeline_category = st.selectbox(
+            "Select Category for Timeline",
+            options=["All"] + observed_categories(filtered_df["Category"]),
+            key="timeline_category",
+        )
+
+    # Sort column and direction for each ordering
+    timeline_sorts = {
+        "Stars (High to Low)": ("Stars", True),
+        "Stars (Low to High)": ("Stars", False),
+        "Lifespan (Longest)": ("lifespan_days", True),
+        "Lifespan (Shortest)": ("lifespan_days", False),
+        "Most Recent": ("Created", True),
+        "Oldest": ("Created", False),
+    }
+
+    with col2:
+        sort_option = st.selectbox(
+            "Sort repositories by",
+            options=list(timeline_sorts),
+            key="timeline_sort",
+        )
+
+    with col3:
+        n_repos = st.slider(
+            "Number of repos", min_value=5, max_value=50, value=20, key="timeline_n"
+        )
+
+    # Filter and sort data for timeline
+    if timeline_category == "All":
+        timeline_df = filtered_df
+    else:
+        timeline_df = filtered_df[filtered_df["Category"] == timeline_category]
+
+    # Apply sorting; the orders are cached per selection, so changing the sort
+    # option or the number of repos only slices
+    timeline_orders = get_timeline_orders(timeline_df)
+    timeline_df = timeline_df.iloc[
+        timeline_orders[timeline_sorts[sort_option]][:n_repos]
+    ]
+
+    if len(timeline_df) > 0:
+        # Create timeline visualization
+        fig_timeline = build_lifespan_timeline(
+            filter_key + (timeline_category, sort_option, n_repos),
+            f"Repository Lifespans Timeline - {timeline_category}",
+            timeline_df,
+            n_repos,
+        )
+
+        st.plotly_chart(fig_timeline, use_container_width=True, config=PLOTLY_CFG)
+
+        # Summary statistics for selected repos
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Avg Lifespan", f"{timeline_df['lifespan_days'].mean():.0f} days")
+        with col2:
+            st.metric("Avg Stars", f"{timeline_df['Stars'].mean():.0f}")
         with col3:
-            n_repos = st.slider(
-                "Number of repos", min_value=5, max_value=50, value=20, key="timeline_n"
+            active_pct = (
+                (timeline_df["recent_activity_category"] == "Active").sum()
+                / len(timeline_df)
+                * 100
             )
+            st.metric("Active %", f"{active_pct:.1f}%")
+        with col4:
+            st.metric("Total Selected", len(timeline_df))
+    else:
+        st.info("No repositories available for the selected filters.")
 
-        # Filter and sort data for timeline
-        if timeline_category == "All":
-            timeline_df = filtered_df.copy()
-        else:
-            timeline_df = filtered_df[
-                filtered_df["Category"] == timeline_category
-            ].copy()
-
-        # Apply sorting
-        if sort_option == "Stars (High to Low)":
-            timeline_df = timeline_df.sort_values("Stars", ascending=False)
-        elif sort_option == "Stars (Low to High)":
-            timeline_df = timeline_df.sort_values("Stars", ascending=True)
-        elif sort_option == "Lifespan (Longest)":
-            timeline_df = timeline_df.sort_values("lifespan_days", ascending=False)
-        elif sort_option == "Lifespan (Shortest)":
-            timeline_df = timeline_df.sort_values("lifespan_days", ascending=True)
-        elif sort_option == "Most Recent":
-            timeline_df = timeline_df.sort_values("first_commit", ascending=False)
-        else:  # Oldest
-            timeline_df = timeline_df.sort_values("first_commit", ascending=True)
-
-        timeline_df = timeline_df.head(n_repos)
-
-        if len(timeline_df) > 0:
-            # Create timeline visualization
-            fig_timeline = go.Figure()
-
-            # Add a line for each repository
-            for idx, row in timeline_df.iterrows():
-                # Create hover text with detailed info
-                hover_text = (
-                    f"<b>{row['Repository']}</b><br>"
-                    f"Stars: {row['Stars']:,}<br>"
-                    f"Category: {row['Category']}<br>"
-                    f"Created: {row['first_commit'].strftime('%Y-%m-%d')}<br>"
-                    f"Last Commit: {row['last_commit'].strftime('%Y-%m-%d')}<br>"
-                    f"Lifespan: {row['lifespan_days']} days<br>"
-                    f"Status: {row['recent_activity_category']}"
-                )
 
-                # Color based on activity
-                line_color = (
-                    "#2ecc71"
-                    if row["recent_activity_category"] == "Active"
-                    else "#e74c3c"
-                )
+# Load data
+try:
+    df, _, _ = load_and_process_data()
+    contrib_stats = load_contribution_data()
 
-                # Add line from creation to last commit
-                fig_timeline.add_trace(
-                    go.Scatter(
-                        x=[row["first_commit"], row["last_commit"]],
-                        y=[row["Repository"], row["Repository"]],
-                        mode="lines+markers",
-                        line=dict(color=line_color, width=3),
-                        marker=dict(size=8, symbol=["circle", "square"]),
-                        hovertext=[hover_text, hover_text],
-                        hoverinfo="text",
-                        showlegend=False,
-                    )
-                )
+    # Title and introduction
+    st.markdown(
+        '<p class="main-header">Healthcare AI Repository Dashboard</p>',
+        unsafe_allow_html=True,
+    )
+    st.markdown(
+        "Explore insights from healthcare AI repositories including stars, activity, and top contributors."
+    )
 
-            # Add legend manually
-            fig_timeline.add_trace(
-                go.Scatter(
-                    x=[None],
-                    y=[None],
-                    mode="markers",
-                    marker=dict(size=10, color="#2ecc71"),
-                    name="Active",
-                    showlegend=True,
-                )
-            )
-            fig_timeline.add_trace(
-                go.Scatter(
-                    x=[None],
-                    y=[None],
-                    mode="markers",
-                    marker=dict(size=10, color="#e74c3c"),
-                    name="Inactive",
-                    showlegend=True,
-                )
-            )
+    # Sidebar filters
+    st.sidebar.header("Filters")
 
-            fig_timeline.update_layout(
-                title=f"Repository Lifespans Timeline - {timeline_category}",
-                xaxis_title="Date",
-                yaxis_title="Repository",
-                height=max(400, n_repos * 25),
-                hovermode="closest",
-                yaxis=dict(tickmode="linear", showgrid=True, gridcolor="lightgray"),
-                xaxis=dict(showgrid=True, gridcolor="lightgray"),
-                plot_bgcolor="white",
-            )
+    # Categories are stored sorted, so the dtype already holds the option list
+    category_options = list(df["Category"].cat.categories)
+    selected_categories = st.sidebar.multiselect(
+        "Select Categories",
+        options=category_options,
+        default=category_options,
+    )
 
-            st.plotly_chart(fig_timeline, use_container_width=True)
+    activity_filter = st.sidebar.radio(
+        "Repository Activity", options=["All", "Active Only", "Inactive Only"], index=0
+    )
 
-            # Summary statistics for selected repos
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric(
-                    "Avg Lifespan", f"{timeline_df['lifespan_days'].mean():.0f} days"
-                )
-            with col2:
-                st.metric("Avg Stars", f"{timeline_df['Stars'].mean():.0f}")
-            with col3:
-                active_pct = (
-                    (timeline_df["recent_activity_category"] == "Active").sum()
-                    / len(timeline_df)
-                    * 100
-                )
-                st.metric("Active %", f"{active_pct:.1f}%")
-            with col4:
-                st.metric("Total Selected", len(timeline_df))
-        else:
-            st.info("No repositories available for the selected filters.")
+    min_stars = st.sidebar.slider(
+        "Minimum Stars", min_value=0, max_value=int(df["Stars"].max()), value=0
+    )
+
+    # Standard filter
+    selected_standard = "All"
+    if "Standard" in df.columns:
+        standard_options = ["All"] + list(df["Standard"].cat.categories)
+        selected_standard = st.sidebar.selectbox(
+            "Filter by Standard", options=standard_options, index=0
+        )
+
+    # Apply filters
+    filter_key = (
+        tuple(sorted(selected_categories)),
+        activity_filter,
+        min_stars,
+        selected_standard,
+    )
+    filtered_df = filter_df(*filter_key)
+
+    # Nothing below has anything to aggregate or plot for an empty selection
+    if filtered_df.empty:
+        st.info("No repositories available for the selected filters.")
+        st.stop()
+
+    # Overview metrics
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("Total Repositories", len(filtered_df))
+    with col2:
+        st.metric("Total Stars", f"{filtered_df['Stars'].sum():,}")
+    with col3:
+        st.metric(
+            "Active Repos",
+            int((filtered_df["recent_activity_category"] == "Active").sum()),
+        )
+    with col4:
+        st.metric("Unique Organizations", filtered_df["Org"].nunique())
+    with col5:
+        if "Standard" in df.columns:
+            std_count = filtered_df[filtered_df["has_standard"]].shape[0]
+            st.metric("With Standards", std_count)
+
+    # Add definitions box
+    with st.expander("ℹ️ Definitions & Methodology"):
+        st.markdown(
+            """
+        **Active Repository**: A repository is considered "active" if it has had at least one commit within the last 365 days.
+
+        **Survival Rate**: The percentage of repositories created in a given year that are still active today (have commits within the last 365 days).
+
+        **Organization vs Individual**: Accounts with more than 3 repositories in this dataset are classified as organizations; others are classified as individuals.
+
+        **Top Contributors**: When contribution statistics are available, contributors are ranked by total lines of code added across all repositories.
+        """
+        )
+
+    # Create tabs for different sections
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        [
+            "Top Repositories",
+            "Category Analysis",
+            "Standards Analysis",
+            "Top Contributors",
+            "Temporal Analysis",
+        ]
+    )
+
+    # TAB 1: Top Repositories
+    with tab1:
+        render_top_repositories_tab(filtered_df, filter_key)
+
+    # TAB 2: Category Analysis
+    with tab2:
+        render_category_tab(filtered_df, filter_key)
+
+    # TAB 3: Standards Analysis
+    with tab3:
+        render_standards_tab(filter_key)
+
+    # TAB 4: Top Contributors
+    with tab4:
+        render_contributors_tab(filtered_df, filter_key, contrib_stats)
+
+    # TAB 5: Temporal Analysis
+    with tab5:
+        render_temporal_tab(filtered_df, filter_key)
 
 except FileNotFoundError:
     st.error(